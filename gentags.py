@@ -1,34 +1,37 @@
 import sys
 
-def open_and_write_header(filename, comment_prefix):
+def write_with_header(filename, comment_prefix, body):
+  header = (
+      comment_prefix + ' Generated via `gentags.py src/tag.in`.\n' +
+      comment_prefix + ' Do not edit; edit src/tag.in instead.\n' +
+      comment_prefix + ' clang-format off\n')
   f = open(filename, 'w')
-  f.write(comment_prefix + ' Generated via `gentags.py src/tag.in`.\n')
-  f.write(comment_prefix + ' Do not edit; edit src/tag.in instead.\n')
-  f.write(comment_prefix + ' clang-format off\n')
-  return f
-
-tag_strings = open_and_write_header('src/tag_strings.h', '//')
-tag_enum = open_and_write_header('src/tag_enum.h', '//')
-tag_sizes = open_and_write_header('src/tag_sizes.h', '//')
-
-tag_py = open_and_write_header('python/gumbo/gumboc_tags.py', '#')
-tag_py.write('TagNames = [\n')
+  f.write(header + body)
+  f.close()
 
 tagfile = open(sys.argv[1])
-
-for tag in tagfile:
-    tag = tag.strip()
-    tag_upper = tag.upper().replace('-', '_')
-    tag_strings.write('"%s",\n' % tag)
-    tag_enum.write('GUMBO_TAG_%s,\n' % tag_upper)
-    tag_sizes.write('%d, ' % len(tag))
-    tag_py.write('  "%s",\n' % tag_upper)
-
+tags = [tag.strip() for tag in tagfile]
 tagfile.close()
 
-tag_strings.close()
-tag_enum.close()
-tag_sizes.close()
-
-tag_py.write(']\n')
-tag_py.close()
+tags_upper = [tag.upper().replace('-', '_') for tag in tags]
+
+# Tag names are packed into one NUL-separated string, indexed by offset.
+offsets = []
+offset = 0
+for tag in tags:
+  offsets.append(offset)
+  offset += len(tag) + 1
+assert offset < 65536, 'kGumboTagOffsets is an array of unsigned short'
+
+write_with_header('src/tag_strings.h', '//',
+                  ''.join('"%s\\0"\n' % tag for tag in tags))
+write_with_header('src/tag_offsets.h', '//',
+                  ''.join('%d, ' % offset for offset in offsets))
+write_with_header('src/tag_enum.h', '//',
+                  ''.join('GUMBO_TAG_%s,\n' % tag for tag in tags_upper))
+write_with_header('src/tag_sizes.h', '//',
+                  ''.join('%d, ' % len(tag) for tag in tags))
+write_with_header('python/gumbo/gumboc_tags.py', '#',
+                  'TagNames = (\n' +
+                  ''.join('  "%s",\n' % tag for tag in tags_upper) +
+                  ')\n')
@@ -23,7 +23,6 @@ Pythonic API.
 __author__ = 'jdtang@google.com (Jonathan Tang)'
 
 import sys
-import contextlib
 import ctypes
 import os.path
 import gumboc_tags
@@ -34,21 +33,36 @@ if sys.platform.startswith('darwin'):
 elif sys.platform.startswith('win'):
   _name_of_lib = "gumbo.dll"
 
-try:
-  # First look for a freshly-built .so in the .libs directory, for development.
-  _dll = ctypes.cdll.LoadLibrary(os.path.join(
-      os.path.dirname(__file__), '..', '..', '.libs', _name_of_lib))
-except OSError:
-  # PyPI or setuptools install, look in the current directory.
-  _dll = ctypes.cdll.LoadLibrary(os.path.join(
-      os.path.dirname(__file__), _name_of_lib))
-except OSError:
+def _load_library():
+  candidates = [
+      # First look for a freshly-built .so in the .libs directory, for
+      # development.
+      os.path.join(os.path.dirname(__file__), '..', '..', '.libs',
+                   _name_of_lib),
+      # PyPI or setuptools install, look in the current directory.
+      os.path.join(os.path.dirname(__file__), _name_of_lib),
+  ]
+  for path in candidates:
+    try:
+      return ctypes.cdll.LoadLibrary(path)
+    except OSError:
+      pass
   # System library, on unix or mac osx
-  _dll = ctypes.cdll.LoadLibrary(_name_of_lib)
+  return ctypes.cdll.LoadLibrary(_name_of_lib)
+
+_dll = _load_library()
 
 # Some aliases for common types.
 _bitvector = ctypes.c_uint
 _Ptr = ctypes.POINTER
+_string_at = ctypes.string_at
+
+try:
+  # Python 2
+  _numeric_types = (int, long)
+except NameError:
+  # Python 3
+  _numeric_types = int
 
 class EnumMetaclass(type(ctypes.c_uint)):
   def __new__(metaclass, name, bases, cls_dict):
@@ -87,10 +101,14 @@ class Enum(ctypes.c_uint):
     return cls(param)
 
   def __eq__(self, other):
-    return self.value == other.value
+    if isinstance(other, Enum):
+      other = other.value
+    return self.value == other
 
   def __ne__(self, other):
-    return self.value != other.value
+    if isinstance(other, Enum):
+      other = other.value
+    return self.value != other
 
   def __hash__(self):
     return hash(self.value)
@@ -113,7 +131,10 @@ class StringPiece(ctypes.Structure):
     return self.length
 
   def __str__(self):
-    return ctypes.string_at(self.data, self.length)
+    return _string_at(self.data, self.length)
+
+  def to_bytes(self):
+    return _string_at(self.data, self.length)
 
 
 class SourcePosition(ctypes.Structure):
@@ -160,48 +181,31 @@ class Vector(ctypes.Structure):
       ('capacity', ctypes.c_uint)
       ]
 
-  class Iter(object):
-    def __init__(self, vector):
-      self.current = 0
-      self.vector = vector
-
-    def __iter__(self):
-      return self
-
-    def __next__(self):
-      # Python 3
-      if self.current >= self.vector.length:
-        raise StopIteration
-      obj = self.vector[self.current]
-      self.current += 1
-      return obj
-
-    def next(self):
-      # Python 2
-      return self.__next__()
+  def _array(self):
+    # ctypes.cast builds a new pointer object on every call, so cast once per
+    # Vector and reuse the typed array for subsequent indexing.
+    array = self.__dict__.get('_typed_array')
+    if array is None:
+      array = ctypes.cast(self.data, _Ptr(_Ptr(self._type_)))
+      self._typed_array = array
+    return array
 
   def __len__(self):
     return self.length
 
   def __getitem__(self, i):
-    try:
-      # Python 2
-      numeric_types = (int, long)
-    except NameError:
-      # Python 3
-      numeric_types = int
-
-    if isinstance(i, numeric_types):
+    if isinstance(i, _numeric_types):
       if i < 0:
         i += self.length
       if i > self.length:
         raise IndexError
-      array_type = _Ptr(_Ptr(self._type_))
-      return ctypes.cast(self.data, array_type)[i].contents
+      return self._array()[i].contents
     return list(self)[i]
 
   def __iter__(self):
-    return Vector.Iter(self)
+    array = self._array()
+    for i in range(self.length):
+      yield array[i].contents
 
 
 Vector.EMPTY = Vector.in_dll(_dll, 'kGumboEmptyVector')
@@ -252,7 +256,7 @@ class Tag(Enum):
     text_ptr = ctypes.c_char_p(tagname.encode('utf-8'))
     return _tag_enum(text_ptr)
 
-  _values_ = gumboc_tags.TagNames + ['UNKNOWN', 'LAST']
+  _values_ = gumboc_tags.TagNames + ('UNKNOWN', 'LAST')
 
 class Element(ctypes.Structure):
   _fields_ = [
@@ -268,17 +272,28 @@ class Element(ctypes.Structure):
 
   @property
   def tag_name(self):
-    original_tag = StringPiece.from_buffer_copy(self.original_tag)
+    # Each field read builds a fresh ctypes object, so read them only once.
+    tag = self.tag
+    is_svg = self.tag_namespace == Namespace.SVG
+    # Known HTML tags map straight to a static string; only unknown tags and
+    # SVG (which has case-sensitive names) need the original text.
+    is_unknown = tag == Tag.UNKNOWN
+    if not is_unknown and not is_svg:
+      return _TAGNAME_CACHE[tag.value]
+    # Copy straight out of our own buffer; reading self.original_tag first
+    # would build an intermediate StringPiece just to copy it.
+    original_tag = StringPiece.from_buffer_copy(self, _ORIGINAL_TAG_OFFSET)
     _tag_from_original_text(ctypes.byref(original_tag))
-    if self.tag_namespace == Namespace.SVG:
+    if is_svg:
       svg_tagname = _normalize_svg_tagname(ctypes.byref(original_tag))
       if svg_tagname is not None:
         return str(svg_tagname)
-    if self.tag == Tag.UNKNOWN:
-      if original_tag.data is None:
+    if is_unknown:
+      # A NULL POINTER(c_char) is falsy, but never None.
+      if not original_tag.data:
         return ''
       return str(original_tag).lower()
-    return _tagname(self.tag)
+    return _TAGNAME_CACHE[tag.value]
 
   def __repr__(self):
     return ('<%r>\n' % self.tag +
@@ -286,6 +301,9 @@ class Element(ctypes.Structure):
             '</%r>' % self.tag)
 
 
+_ORIGINAL_TAG_OFFSET = Element.original_tag.offset
+
+
 class Text(ctypes.Structure):
   _fields_ = [
       ('text', ctypes.c_char_p),
@@ -301,6 +319,10 @@ class NodeType(Enum):
   _values_ = ['DOCUMENT', 'ELEMENT', 'TEXT', 'CDATA',
               'COMMENT', 'WHITESPACE', 'TEMPLATE']
 
+_DOCUMENT = NodeType.DOCUMENT.value
+_ELEMENT = NodeType.ELEMENT.value
+_TEMPLATE = NodeType.TEMPLATE.value
+
 
 class NodeUnion(ctypes.Union):
   _fields_ = [
@@ -316,12 +338,20 @@ class Node(ctypes.Structure):
   def _contents(self):
     # Python3 enters an infinite loop if you use an @property within
     # __getattr__, so we factor it out to a helper.
-    if self.type == NodeType.DOCUMENT:
-      return self.v.document
-    elif self.type in (NodeType.ELEMENT, NodeType.TEMPLATE):
-      return self.v.element
+    # This runs on every attribute access, so the resolved union member is
+    # cached.  __setattr__ forwards to the contents, hence the raw __dict__.
+    contents = self.__dict__.get('_cached_contents')
+    if contents is not None:
+      return contents
+    node_type = self.type.value
+    if node_type == _DOCUMENT:
+      contents = self.v.document
+    elif node_type == _ELEMENT or node_type == _TEMPLATE:
+      contents = self.v.element
     else:
-      return self.v.text
+      contents = self.v.text
+    self.__dict__['_cached_contents'] = contents
+    return contents
 
   @property
   def contents(self):
@@ -372,50 +402,80 @@ class Output(ctypes.Structure):
       ('errors', Vector),
       ]
 
-@contextlib.contextmanager
+class _ParseContext(object):
+  """Context manager returned by parse().
+
+  The parse runs on __enter__ and the output is freed on __exit__.  A plain
+  class avoids the generator and wrapper objects that contextlib would
+  allocate for every parse.
+  """
+  __slots__ = ('_options', '_text_ptr', '_length', '_output')
+
+  def __init__(self, options, text_ptr, length):
+    self._options = options
+    self._text_ptr = text_ptr
+    self._length = length
+    self._output = None
+
+  def __enter__(self):
+    self._output = _parse_with_options(
+        ctypes.byref(self._options), self._text_ptr, self._length)
+    return self._output
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    _destroy_output(ctypes.byref(self._options), self._output)
+    self._output = None
+
+
 def parse(text, **kwargs):
+  # Start from a raw copy of the library defaults, then override only the
+  # options the caller actually passed.
   options = Options()
-  for field_name, _ in Options._fields_:
-    try:
-      setattr(options, field_name, kwargs[field_name])
-    except KeyError:
-      setattr(options, field_name, getattr(_DEFAULT_OPTIONS, field_name))
+  ctypes.memmove(ctypes.byref(options), ctypes.byref(_DEFAULT_OPTIONS),
+                 ctypes.sizeof(Options))
+  for field_name, value in kwargs.items():
+    field = _OPTION_FIELDS.get(field_name)
+    if field is not None:
+      field.__set__(options, value)
   # We have to manually take a reference to the input text here so that it
   # outlives the parse output.  If we let ctypes do it automatically on function
   # call, it creates a temporary buffer which is destroyed when the call
   # completes, and then the original_text pointers point into invalid memory.
-  text_ptr = ctypes.c_char_p(text.encode('utf-8'))
-  output = _parse_with_options(ctypes.byref(options), text_ptr, len(text))
-  try:
-    yield output
-  finally:
-    _destroy_output(ctypes.byref(options), output)
+  encoded = text.encode('utf-8')
+  return _ParseContext(options, ctypes.c_char_p(encoded), len(encoded))
 
 _DEFAULT_OPTIONS = Options.in_dll(_dll, 'kGumboDefaultOptions')
 
-_parse_with_options = _dll.gumbo_parse_with_options
-_parse_with_options.argtypes = [_Ptr(Options), ctypes.c_char_p, ctypes.c_size_t]
-_parse_with_options.restype = _Ptr(Output)
-
-_tag_from_original_text = _dll.gumbo_tag_from_original_text
-_tag_from_original_text.argtypes = [_Ptr(StringPiece)]
-_tag_from_original_text.restype = None
-
-_normalize_svg_tagname = _dll.gumbo_normalize_svg_tagname
-_normalize_svg_tagname.argtypes = [_Ptr(StringPiece)]
-_normalize_svg_tagname.restype = ctypes.c_char_p
-
-_destroy_output = _dll.gumbo_destroy_output
-_destroy_output.argtypes = [_Ptr(Options), _Ptr(Output)]
-_destroy_output.restype = None
-
-_tagname = _dll.gumbo_normalized_tagname
-_tagname.argtypes = [Tag]
-_tagname.restype = ctypes.c_char_p
+# The ctypes field descriptors of Options, so parse() can set options without
+# resolving each name through the class on every call.
+_OPTION_FIELDS = dict(
+    (name, getattr(Options, name)) for name, _ in Options._fields_)
+
+# (Python name, C symbol, argtypes, restype) for each libgumbo function we call.
+_FUNCTIONS = [
+    ('_parse_with_options', 'gumbo_parse_with_options',
+     [_Ptr(Options), ctypes.c_char_p, ctypes.c_size_t], _Ptr(Output)),
+    ('_tag_from_original_text', 'gumbo_tag_from_original_text',
+     [_Ptr(StringPiece)], None),
+    ('_normalize_svg_tagname', 'gumbo_normalize_svg_tagname',
+     [_Ptr(StringPiece)], ctypes.c_char_p),
+    ('_destroy_output', 'gumbo_destroy_output',
+     [_Ptr(Options), _Ptr(Output)], None),
+    ('_tagname', 'gumbo_normalized_tagname', [Tag], ctypes.c_char_p),
+    ('_tag_enum', 'gumbo_tag_enum', [ctypes.c_char_p], Tag),
+    ]
 
-_tag_enum = _dll.gumbo_tag_enum
-_tag_enum.argtypes = [ctypes.c_char_p]
-_tag_enum.restype = Tag
+for _name, _symbol, _argtypes, _restype in _FUNCTIONS:
+  _function = getattr(_dll, _symbol)
+  _function.argtypes = _argtypes
+  _function.restype = _restype
+  globals()[_name] = _function
+del _name, _symbol, _argtypes, _restype, _function
+
+# gumbo_normalized_tagname returns static strings, so fetch each one once at
+# import instead of crossing the FFI boundary for every element.
+_TAGNAME_CACHE = dict(
+    (i, _tagname(Tag(i))) for i in range(len(Tag._values_)))
 
 __all__ = ['StringPiece', 'SourcePosition', 'AttributeNamespace', 'Attribute',
            'Vector', 'AttributeVector', 'NodeVector', 'QuirksMode', 'Document',
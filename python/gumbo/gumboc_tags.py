@@ -1,7 +1,7 @@
 # Generated via `gentags.py src/tag.in`.
 # Do not edit; edit src/tag.in instead.
 # clang-format off
-TagNames = [
+TagNames = (
   "HTML",
   "HEAD",
   "TITLE",
@@ -152,4 +152,4 @@ TagNames = [
   "SPACER",
   "TT",
   "RTC",
-]
+)
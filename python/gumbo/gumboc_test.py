@@ -100,11 +100,31 @@ class CtypesTest(unittest.TestCase):
       self.assertEquals(gumboc.Tag.UNKNOWN, sarcasm.tag)
       self.assertEquals('<sarcasm>', str(sarcasm.original_tag))
       self.assertEquals('</sarcasm>', str(sarcasm.original_end_tag))
+      self.assertEquals(b'</sarcasm>', sarcasm.original_end_tag.to_bytes())
       self.assertEquals('sarcasm', sarcasm.tag_name.decode('utf-8'))
 
+  def testNonAsciiText(self):
+    with gumboc.parse(u'<p>\xe9t\xe9') as output:
+      root = output.contents.root.contents
+      p = root.children[1].children[0]
+      self.assertEquals(u'\xe9t\xe9', p.children[0].text.decode('utf-8'))
+
+  def testSvgTagName(self):
+    with gumboc.parse('<svg><foreignObject></foreignObject></svg>') as output:
+      root = output.contents.root.contents
+      body = root.children[1]
+      svg = body.children[0]
+      self.assertEquals(gumboc.Namespace.SVG, svg.tag_namespace)
+      self.assertEquals('svg', svg.tag_name)
+      foreign_object = svg.children[0]
+      self.assertEquals(gumboc.Namespace.SVG, foreign_object.tag_namespace)
+      self.assertEquals('foreignObject', foreign_object.tag_name)
+
   def testEnums(self):
     self.assertEquals(gumboc.Tag.A, gumboc.Tag.A)
     self.assertEquals(hash(gumboc.Tag.A.value), hash(gumboc.Tag.A))
+    self.assertEquals(gumboc.NodeType.ELEMENT.value, gumboc.NodeType.ELEMENT)
+    self.assertNotEquals(gumboc.NodeType.TEXT.value, gumboc.NodeType.ELEMENT)
 
   def testFragment(self):
     with gumboc.parse(
@@ -148,6 +148,11 @@ class Html5libAdapterTest(unittest.TestCase):
     # TODO(jdtang): Check error messages, when there's full error support.
 
 
+# Arguments to Html5libAdapterTest.impl for each generated test method; every
+# method shares one code object and differs only in its index into this list.
+_CASES = []
+
+
 def BuildTestCases(cls):
   for filename in html5lib_test_files():
     test_name = os.path.basename(filename).replace('.dat', '')
@@ -167,13 +172,14 @@ def BuildTestCases(cls):
       if '<command>' in test['data']:
         continue
 
-      def test_func(
-          self,
-          inner_html=test['document-fragment'],
-          input=test['data'],
-          expected=test['document'],
-          errors=test.get('errors', '').split('\n')):
-        return self.impl(inner_html, input, expected, errors)
+      _CASES.append((
+          test['document-fragment'],
+          test['data'],
+          test['document'],
+          test.get('errors', '').split('\n')))
+
+      def test_func(self, index=len(_CASES) - 1):
+        return self.impl(*_CASES[index])
       test_func.__name__ = 'test_%s_%d' % (test_name, i + 1)
       setattr(cls, test_func.__name__, test_func)
 
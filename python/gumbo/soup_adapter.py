@@ -26,16 +26,26 @@ import BeautifulSoup
 import gumboc
 
 
+# Bound once so the per-node code paths skip the module attribute lookups.
+_decode = bytes.decode
+_Tag = BeautifulSoup.Tag
+_NavigableString = BeautifulSoup.NavigableString
+_CData = BeautifulSoup.CData
+_Comment = BeautifulSoup.Comment
+
+
 def _utf8(text):
-  return text.decode('utf-8', 'replace')
+  return _decode(text, 'utf-8', 'replace')
 
 
 def _add_source_info(obj, original_text, start_pos, end_pos):
-  obj.original = str(original_text)
+  # These are part of the adapter's API, so they stay plain attributes; one
+  # store per field is also cheaper than batching them via __dict__.update.
+  obj.original = original_text.to_bytes()
   obj.line = start_pos.line
   obj.col = start_pos.column
   obj.offset = start_pos.offset
-  if end_pos:
+  if end_pos is not None:
     obj.end_line = end_pos.line
     obj.end_col = end_pos.column
     obj.end_offset = end_pos.offset
@@ -45,31 +55,47 @@ def _convert_attrs(attrs):
   # TODO(jdtang): Ideally attributes would pass along their positions as well,
   # but I can't extend the built in str objects with new attributes.  Maybe work
   # around this with a subclass in some way...
-  return [(_utf8(attr.name), _utf8(attr.value)) for attr in attrs]
+  return [(_decode(attr.name, 'utf-8', 'replace'),
+           _decode(attr.value, 'utf-8', 'replace'))
+          for attr in attrs]
 
 
-def _add_document(soup, element):
+def _add_document(soup, nodes, element):
   # Currently ignored, since there's no real place for this in the BeautifulSoup
   # API.
   pass
 
 
-def _add_element(soup, element):
+def _add_element(soup, nodes, element):
   # TODO(jdtang): Expose next/previous in gumbo so they can be passed along to
   # BeautifulSoup.
-  tag = BeautifulSoup.Tag(
+  tag = _Tag(
       soup, _utf8(element.tag_name), _convert_attrs(element.attributes))
-  for child in element.children:
-    tag.append(_add_node(soup, child))
+  nodes.append(tag)
+  # Link the children up by hand instead of through Tag.append, which also
+  # searches for .next/.previous; _add_next_prev_pointers overwrites those
+  # afterwards anyway.
+  children = [_add_node(soup, nodes, child) for child in element.children]
+  previous = None
+  for child in children:
+    child.parent = tag
+    child.previousSibling = previous
+    if previous is not None:
+      previous.nextSibling = child
+    previous = child
+  if previous is not None:
+    previous.nextSibling = None
+  tag.contents = children
   _add_source_info(
       tag, element.original_tag, element.start_pos, element.end_pos)
-  tag.original_end_tag = str(element.original_end_tag)
+  tag.original_end_tag = element.original_end_tag.to_bytes()
   return tag
 
 
 def _add_text(cls):
-  def add_text_internal(soup, element):
+  def add_text_internal(soup, nodes, element):
     text = cls(_utf8(element.text))
+    nodes.append(text)
     _add_source_info(text, element.original_text, element.start_pos, None)
     return text
   return add_text_internal
@@ -78,37 +104,27 @@ def _add_text(cls):
 _HANDLERS = [
     _add_document,
     _add_element,
-    _add_text(BeautifulSoup.NavigableString),
-    _add_text(BeautifulSoup.CData),
-    _add_text(BeautifulSoup.Comment),
-    _add_text(BeautifulSoup.NavigableString),
+    _add_text(_NavigableString),
+    _add_text(_CData),
+    _add_text(_Comment),
+    _add_text(_NavigableString),
     _add_element,
     ]
 
 
-def _add_node(soup, node):
-  return _HANDLERS[node.type.value](soup, node.contents)
-
+def _add_node(soup, nodes, node):
+  return _HANDLERS[node.type.value](soup, nodes, node.contents)
 
-def _add_next_prev_pointers(soup):
-  def _traverse(node):
-    # .findAll requires the .next pointer, which is what we're trying to add
-    # when we call this, and so we manually supply a generator to yield the
-    # nodes in DOM order.
-    yield node
-    try:
-      for child in node.contents:
-        for descendant in _traverse(child):
-          yield descendant
-    except AttributeError:
-      # Not an element.
-      return
 
-  nodes = sorted(_traverse(soup), key=lambda node: node.offset)
+def _add_next_prev_pointers(nodes):
+  # .findAll requires the .next pointer, which is what we're trying to add
+  # when we call this.  The nodes are collected in DOM order while converting,
+  # so this needs no second walk over the tree.
+  nodes.sort(key=lambda node: node.offset)
   if nodes:
     nodes[0].previous = None
     nodes[-1].next = None
-  for i, node in enumerate(nodes[1:-1], 1):
+  for i, node in enumerate(nodes[1:], 1):
     nodes[i-1].next = node
     node.previous = nodes[i-1]
 
@@ -116,6 +132,7 @@ def _add_next_prev_pointers(soup):
 def parse(text, **kwargs):
   with gumboc.parse(text, **kwargs) as output:
     soup = BeautifulSoup.BeautifulSoup()
-    soup.append(_add_node(soup, output.contents.root.contents))
-    _add_next_prev_pointers(soup)
+    nodes = [soup]
+    soup.append(_add_node(soup, nodes, output.contents.root.contents))
+    _add_next_prev_pointers(nodes)
     return soup
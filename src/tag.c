@@ -20,10 +20,17 @@
 #include <ctype.h>
 #include <string.h>
 
-const char* kGumboTagNames[] = {
+// All tag names, packed into a single NUL-separated buffer and indexed by
+// kGumboTagOffsets.  Compared to an array of pointers this is smaller and needs
+// no load-time relocations.
+static const char kGumboTagStrings[] =
 #include "tag_strings.h"
-    "",  // TAG_UNKNOWN
-    "",  // TAG_LAST
+    "";  // TAG_UNKNOWN and TAG_LAST share the final NUL.
+
+static const unsigned short kGumboTagOffsets[] = {
+#include "tag_offsets.h"
+    sizeof(kGumboTagStrings) - 1,  // TAG_UNKNOWN
+    sizeof(kGumboTagStrings) - 1,  // TAG_LAST
 };
 
 static const unsigned char kGumboTagSizes[] = {
@@ -34,7 +41,7 @@ static const unsigned char kGumboTagSizes[] = {
 
 const char* gumbo_normalized_tagname(GumboTag tag) {
   assert(tag <= GUMBO_TAG_LAST);
-  return kGumboTagNames[tag];
+  return kGumboTagStrings + kGumboTagOffsets[tag];
 }
 
 void gumbo_tag_from_original_text(GumboStringPiece* text) {
@@ -83,7 +90,8 @@ GumboTag gumbo_tagn_enum(const char* tagname, unsigned int length) {
     if (key < TAG_MAP_SIZE) {
       GumboTag tag = kGumboTagMap[key];
       if (length == kGumboTagSizes[(int) tag] &&
-          !case_memcmp(tagname, kGumboTagNames[(int) tag], length))
+          !case_memcmp(
+              tagname, kGumboTagStrings + kGumboTagOffsets[(int) tag], length))
         return tag;
     }
   }
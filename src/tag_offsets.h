@@ -0,0 +1,4 @@
+// Generated via `gentags.py src/tag.in`.
+// Do not edit; edit src/tag.in instead.
+// clang-format off
+0, 5, 10, 16, 21, 26, 31, 37, 44, 53, 62, 67, 75, 83, 87, 93, 96, 99, 102, 105, 108, 111, 118, 125, 132, 140, 142, 145, 149, 160, 163, 166, 169, 172, 175, 178, 185, 196, 201, 205, 207, 210, 217, 223, 225, 230, 232, 236, 241, 246, 251, 256, 260, 265, 269, 273, 277, 279, 281, 283, 288, 293, 296, 299, 303, 307, 312, 315, 319, 323, 327, 333, 337, 344, 350, 357, 363, 369, 375, 382, 388, 395, 399, 404, 409, 412, 415, 418, 421, 427, 434, 445, 460, 464, 478, 483, 489, 497, 506, 510, 516, 522, 528, 531, 534, 537, 542, 551, 558, 564, 570, 577, 584, 593, 602, 609, 618, 625, 632, 641, 647, 655, 663, 668, 677, 684, 692, 700, 704, 710, 719, 728, 736, 744, 748, 755, 763, 773, 776, 783, 792, 796, 802, 809, 814, 822, 831, 836, 843, 846, 
\ No newline at end of file
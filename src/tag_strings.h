@@ -1,153 +1,153 @@
 // Generated via `gentags.py src/tag.in`.
 // Do not edit; edit src/tag.in instead.
 // clang-format off
-"html",
-"head",
-"title",
-"base",
-"link",
-"meta",
-"style",
-"script",
-"noscript",
-"template",
-"body",
-"article",
-"section",
-"nav",
-"aside",
-"h1",
-"h2",
-"h3",
-"h4",
-"h5",
-"h6",
-"hgroup",
-"header",
-"footer",
-"address",
-"p",
-"hr",
-"pre",
-"blockquote",
-"ol",
-"ul",
-"li",
-"dl",
-"dt",
-"dd",
-"figure",
-"figcaption",
-"main",
-"div",
-"a",
-"em",
-"strong",
-"small",
-"s",
-"cite",
-"q",
-"dfn",
-"abbr",
-"data",
-"time",
-"code",
-"var",
-"samp",
-"kbd",
-"sub",
-"sup",
-"i",
-"b",
-"u",
-"mark",
-"ruby",
-"rt",
-"rp",
-"bdi",
-"bdo",
-"span",
-"br",
-"wbr",
-"ins",
-"del",
-"image",
-"img",
-"iframe",
-"embed",
-"object",
-"param",
-"video",
-"audio",
-"source",
-"track",
-"canvas",
-"map",
-"area",
-"math",
-"mi",
-"mo",
-"mn",
-"ms",
-"mtext",
-"mglyph",
-"malignmark",
-"annotation-xml",
-"svg",
-"foreignobject",
-"desc",
-"table",
-"caption",
-"colgroup",
-"col",
-"tbody",
-"thead",
-"tfoot",
-"tr",
-"td",
-"th",
-"form",
-"fieldset",
-"legend",
-"label",
-"input",
-"button",
-"select",
-"datalist",
-"optgroup",
-"option",
-"textarea",
-"keygen",
-"output",
-"progress",
-"meter",
-"details",
-"summary",
-"menu",
-"menuitem",
-"applet",
-"acronym",
-"bgsound",
-"dir",
-"frame",
-"frameset",
-"noframes",
-"isindex",
-"listing",
-"xmp",
-"nextid",
-"noembed",
-"plaintext",
-"rb",
-"strike",
-"basefont",
-"big",
-"blink",
-"center",
-"font",
-"marquee",
-"multicol",
-"nobr",
-"spacer",
-"tt",
-"rtc",
+"html\0"
+"head\0"
+"title\0"
+"base\0"
+"link\0"
+"meta\0"
+"style\0"
+"script\0"
+"noscript\0"
+"template\0"
+"body\0"
+"article\0"
+"section\0"
+"nav\0"
+"aside\0"
+"h1\0"
+"h2\0"
+"h3\0"
+"h4\0"
+"h5\0"
+"h6\0"
+"hgroup\0"
+"header\0"
+"footer\0"
+"address\0"
+"p\0"
+"hr\0"
+"pre\0"
+"blockquote\0"
+"ol\0"
+"ul\0"
+"li\0"
+"dl\0"
+"dt\0"
+"dd\0"
+"figure\0"
+"figcaption\0"
+"main\0"
+"div\0"
+"a\0"
+"em\0"
+"strong\0"
+"small\0"
+"s\0"
+"cite\0"
+"q\0"
+"dfn\0"
+"abbr\0"
+"data\0"
+"time\0"
+"code\0"
+"var\0"
+"samp\0"
+"kbd\0"
+"sub\0"
+"sup\0"
+"i\0"
+"b\0"
+"u\0"
+"mark\0"
+"ruby\0"
+"rt\0"
+"rp\0"
+"bdi\0"
+"bdo\0"
+"span\0"
+"br\0"
+"wbr\0"
+"ins\0"
+"del\0"
+"image\0"
+"img\0"
+"iframe\0"
+"embed\0"
+"object\0"
+"param\0"
+"video\0"
+"audio\0"
+"source\0"
+"track\0"
+"canvas\0"
+"map\0"
+"area\0"
+"math\0"
+"mi\0"
+"mo\0"
+"mn\0"
+"ms\0"
+"mtext\0"
+"mglyph\0"
+"malignmark\0"
+"annotation-xml\0"
+"svg\0"
+"foreignobject\0"
+"desc\0"
+"table\0"
+"caption\0"
+"colgroup\0"
+"col\0"
+"tbody\0"
+"thead\0"
+"tfoot\0"
+"tr\0"
+"td\0"
+"th\0"
+"form\0"
+"fieldset\0"
+"legend\0"
+"label\0"
+"input\0"
+"button\0"
+"select\0"
+"datalist\0"
+"optgroup\0"
+"option\0"
+"textarea\0"
+"keygen\0"
+"output\0"
+"progress\0"
+"meter\0"
+"details\0"
+"summary\0"
+"menu\0"
+"menuitem\0"
+"applet\0"
+"acronym\0"
+"bgsound\0"
+"dir\0"
+"frame\0"
+"frameset\0"
+"noframes\0"
+"isindex\0"
+"listing\0"
+"xmp\0"
+"nextid\0"
+"noembed\0"
+"plaintext\0"
+"rb\0"
+"strike\0"
+"basefont\0"
+"big\0"
+"blink\0"
+"center\0"
+"font\0"
+"marquee\0"
+"multicol\0"
+"nobr\0"
+"spacer\0"
+"tt\0"
+"rtc\0"